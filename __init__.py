@@ -10,121 +10,191 @@ import os
 import sys
 import argparse
 
-try:
-    from pytest_migration_lib import tracking, automigrate
-except ImportError:
-    # Add parent directory to path for development mode
-    parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    sys.path.insert(0, parent_dir)
+__version__ = "0.1.0"
+
+tracking = None
+automigrate = None
+
+def _load_lib():
+    """Import the migration library on first use.
+
+    Deferring this keeps --help and argument-parsing errors fast, since
+    the library pulls in a lot of transitive modules.
+    """
+    global tracking, automigrate
+
+    if tracking is not None and automigrate is not None:
+        return
+
     try:
         from pytest_migration_lib import tracking, automigrate
     except ImportError:
-        print("Error: Could not import pytest_migration_lib.")
-        print("Make sure it's correctly installed.")
-        sys.exit(1)
-
-__version__ = "0.1.0"
+        # Add parent directory to path for development mode
+        parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        sys.path.insert(0, parent_dir)
+        try:
+            from pytest_migration_lib import tracking, automigrate
+        except ImportError:
+            print("Error: Could not import pytest_migration_lib.")
+            print("Make sure it's correctly installed.")
+            sys.exit(1)
 
-def main():
-    """Main entry point for the migration tool."""
-    parser = argparse.ArgumentParser(description="Universal nose to pytest migration toolkit")
-    subparsers = parser.add_subparsers(dest="command", help="Command group")
-    
-    # Track commands
+def _build_track(subparsers):
+    """Build the track subparser tree."""
     track_parser = subparsers.add_parser("track", help="Migration tracking commands")
     track_subparsers = track_parser.add_subparsers(dest="subcommand", help="Tracking command")
-    
+
     track_subparsers.add_parser("init", help="Initialize migration tracking")
     track_subparsers.add_parser("status", help="Show migration status")
-    
+
     update_parser = track_subparsers.add_parser("update", help="Mark a file as migrated")
     update_parser.add_argument("path", help="Path to migrated test file")
-    
+
     scan_parser = track_subparsers.add_parser("scan", help="Scan for test files")
-    scan_parser.add_argument("path", nargs="?", help="Directory to scan (optional)")
-    
-    # Run commands
+    scan_parser.add_argument("path", nargs="?", default=None, help="Directory to scan (optional)")
+
+def _build_run(subparsers):
+    """Build the run subparser."""
     run_parser = subparsers.add_parser("run", help="Run tests with pytest")
     run_parser.add_argument("path", help="Path to test file or directory")
-    
-    # Auto commands
+
+def _build_auto(subparsers):
+    """Build the auto subparser tree."""
     auto_parser = subparsers.add_parser("auto", help="Automated migration commands")
     auto_subparsers = auto_parser.add_subparsers(dest="subcommand", help="Automation command")
-    
+
     auto_scan_parser = auto_subparsers.add_parser("scan", help="Scan for nose tests")
-    auto_scan_parser.add_argument("path", nargs="?", help="Directory to scan (optional)")
-    
+    auto_scan_parser.add_argument("path", nargs="?", default=None, help="Directory to scan (optional)")
+
     auto_migrate_parser = auto_subparsers.add_parser("migrate", help="Run automated migration")
-    auto_migrate_parser.add_argument("path", nargs="?", help="Path to migrate (file or directory)")
-    
+    auto_migrate_parser.add_argument("path", nargs="?", default=None, help="Path to migrate (file or directory)")
+
     auto_subparsers.add_parser("verify", help="Verify migrated tests")
     auto_subparsers.add_parser("config", help="Configure auto-migration settings")
     auto_subparsers.add_parser("patterns", help="List transformation patterns")
     auto_subparsers.add_parser("add-pattern", help="Add a new transformation pattern")
-    
-    args = parser.parse_args()
-    
-    if args.command == "track":
-        return track_command(args)
-    elif args.command == "run":
-        return run_command(args)
-    elif args.command == "auto":
-        return auto_command(args)
+
+_BUILDERS = {
+    "track": _build_track,
+    "run": _build_run,
+    "auto": _build_auto,
+}
+
+# The top-level help text is static, so the "run it to see what it does"
+# path can print it without building any parser at all.
+_FAST_HELP = """\
+usage: nosey-pytest [-h] {track,run,auto} ...
+
+Universal nose to pytest migration toolkit
+
+positional arguments:
+  {track,run,auto}  Command group
+    track           Migration tracking commands
+    run             Run tests with pytest
+    auto            Automated migration commands
+
+options:
+  -h, --help        show this help message and exit"""
+
+def main():
+    """Main entry point for the migration tool."""
+    # Fast path: no arguments or top-level help never needs argparse or
+    # the migration library.
+    if len(sys.argv) == 1 or sys.argv[1] in ("-h", "--help"):
+        print(_FAST_HELP)
+        return 0
+
+    parser = argparse.ArgumentParser(description="Universal nose to pytest migration toolkit")
+    subparsers = parser.add_subparsers(dest="command", help="Command group")
+
+    # Only construct the subparser tree for the command actually requested.
+    # Unknown commands are the rare path and build everything so argparse
+    # can render the full usage text.
+    builder = _BUILDERS.get(sys.argv[1])
+    if builder is not None:
+        builder(subparsers)
     else:
-        parser.print_help()
-    
+        for build in _BUILDERS.values():
+            build(subparsers)
+
+    args = parser.parse_args()
+
+    handler = _COMMANDS.get(args.command)
+    if handler is not None:
+        return handler(args)
+
+    parser.print_help()
     return 0
 
+def _norm(path):
+    """Normalize a CLI path argument to an absolute path (None passes through)."""
+    return os.path.abspath(path) if path else None
+
+def _track_update(args):
+    if not args.path:
+        print("Error: Missing file path.")
+        return 1
+    tracking.update_test_status(_norm(args.path))
+
+# Handler tables resolve the lazily-loaded library globals at call time,
+# after _load_lib has run.
+_TRACK_HANDLERS = {
+    "init": lambda args: tracking.initialize_migration(),
+    "status": lambda args: tracking.display_status(),
+    "update": _track_update,
+    "scan": lambda args: tracking.rescan_tests(_norm(args.path)),
+}
+
 def track_command(args):
     """Handle tracking commands."""
-    if args.subcommand == 'init':
-        return tracking.initialize_migration()
-    elif args.subcommand == 'status':
-        tracking.display_status()
-    elif args.subcommand == 'update':
-        if not args.path:
-            print("Error: Missing file path.")
-            return 1
-        abs_path = os.path.abspath(args.path) if os.path.isabs(args.path) else os.path.join(os.getcwd(), args.path)
-        tracking.update_test_status(abs_path)
-    elif args.subcommand == 'scan':
-        dir_path = None
-        if hasattr(args, 'path') and args.path:
-            dir_path = os.path.abspath(args.path) if os.path.isabs(args.path) else os.path.join(os.getcwd(), args.path)
-        tracking.rescan_tests(dir_path)
-    else:
+    _load_lib()
+
+    handler = _TRACK_HANDLERS.get(args.subcommand)
+    if handler is None:
         print("Unknown track command.")
         return 1
-    
-    return 0
+
+    result = handler(args)
+    return result if result is not None else 0
 
 def run_command(args):
     """Handle run commands."""
+    _load_lib()
+
     if not args.path:
         print("Error: Missing test path.")
         return 1
     
     return tracking.run_test(args.path)
 
+# Paths are normalized once here, so automigrate receives absolute paths
+# just like the track commands do.
+_AUTO_HANDLERS = {
+    "scan": lambda args: automigrate.scan_command(_norm(args.path)),
+    "migrate": lambda args: automigrate.migrate_command(_norm(args.path)),
+    "verify": lambda args: automigrate.verify_command(),
+    "config": lambda args: automigrate.update_config(),
+    "patterns": lambda args: automigrate.list_patterns_command(),
+    "add-pattern": lambda args: automigrate.add_pattern_command(),
+}
+
 def auto_command(args):
     """Handle auto commands."""
-    if args.subcommand == 'scan':
-        automigrate.scan_command(args.path if hasattr(args, 'path') else None)
-    elif args.subcommand == 'migrate':
-        automigrate.migrate_command(args.path if hasattr(args, 'path') else None)
-    elif args.subcommand == 'verify':
-        automigrate.verify_command()
-    elif args.subcommand == 'config':
-        automigrate.update_config()
-    elif args.subcommand == 'patterns':
-        automigrate.list_patterns_command()
-    elif args.subcommand == 'add-pattern':
-        automigrate.add_pattern_command()
-    else:
+    _load_lib()
+
+    handler = _AUTO_HANDLERS.get(args.subcommand)
+    if handler is None:
         print("Unknown auto command.")
         return 1
-    
+
+    handler(args)
     return 0
 
+_COMMANDS = {
+    "track": track_command,
+    "run": run_command,
+    "auto": auto_command,
+}
+
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
@@ -11,40 +11,71 @@ Usage:
 import os
 import sys
 import argparse
-import subprocess
+import datetime
 import tempfile
 import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 import git  # GitPython library
 
 # Import local modules
 try:
-    from src.automigrate import find_nose_test_files, migrate_file, verify_migration
+    from src.automigrate import find_nose_test_files, migrate_file, verify_migrations_batch
     from src.tracking import create_default_migration_data, update_test_status
 except ImportError:
     sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-    from src.automigrate import find_nose_test_files, migrate_file, verify_migration
+    from src.automigrate import find_nose_test_files, migrate_file, verify_migrations_batch
     from src.tracking import create_default_migration_data, update_test_status
 
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description='Migrate nose tests to pytest')
     parser.add_argument('repo_url', help='Git repository URL to clone')
-    parser.add_argument('target_dir', nargs='?', default=None, 
+    parser.add_argument('target_dir', nargs='?', default=None,
                         help='Target directory for the repository (optional)')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(),
+                        help='Number of parallel migration workers (use 1 for serial debugging)')
+    parser.add_argument('--full-clone', action='store_true',
+                        help='Clone full history and all branches instead of a shallow single-branch clone')
+    parser.add_argument('--no-shm', action='store_true',
+                        help='Do not place the temporary clone on /dev/shm (tmpfs)')
     return parser.parse_args()
 
-def clone_repository(repo_url: str, target_dir: Optional[str] = None) -> str:
+# Minimum free space on /dev/shm before we'll clone onto it
+_SHM_MIN_FREE_BYTES = 1 << 30
+
+def _make_temp_dir(use_shm: bool = True) -> str:
+    """Create a temporary directory for the clone, preferring tmpfs.
+
+    The clone/scan/verify pipeline writes and re-reads every file, so
+    placing the tree on /dev/shm keeps the whole run in memory when there
+    is room for it.
+    """
+    if use_shm and os.path.isdir("/dev/shm"):
+        try:
+            if shutil.disk_usage("/dev/shm").free >= _SHM_MIN_FREE_BYTES:
+                return tempfile.mkdtemp(prefix="nosey_pytest_", dir="/dev/shm")
+        except OSError:
+            pass
+    return tempfile.mkdtemp(prefix="nosey_pytest_")
+
+def clone_repository(repo_url: str, target_dir: Optional[str] = None,
+                     full_clone: bool = False, use_shm: bool = True) -> Tuple[str, "git.Repo"]:
     """
     Clone a Git repository to the specified directory or a temporary directory.
-    
+
+    By default only the tip commit of the default branch is fetched, since
+    the migration only touches working-tree files; pass full_clone=True for
+    complete history and all branches.
+
     Args:
         repo_url: URL of the Git repository to clone
         target_dir: Target directory for the repository (optional)
-        
+        full_clone: Fetch full history and all branches
+
     Returns:
-        Path to the cloned repository
+        Tuple of (path to the cloned repository, Repo object)
     """
     if target_dir:
         target_path = os.path.abspath(target_dir)
@@ -54,14 +85,15 @@ def clone_repository(repo_url: str, target_dir: Optional[str] = None) -> str:
             if response.lower() != 'y':
                 sys.exit(1)
     else:
-        target_path = tempfile.mkdtemp(prefix="nosey_pytest_")
+        target_path = _make_temp_dir(use_shm)
     
     print(f"Cloning repository {repo_url} to {target_path}...")
+    clone_opts = {} if full_clone else {"depth": 1, "single_branch": True, "no_tags": True}
     try:
-        git.Repo.clone_from(repo_url, target_path)
-        
+        # clone_from already returns the Repo object; no need to re-open it
+        repo = git.Repo.clone_from(repo_url, target_path, **clone_opts)
+
         # Create a migration branch
-        repo = git.Repo(target_path)
         migration_branch = "pytest-migration"
         
         # Check if the branch already exists
@@ -71,8 +103,8 @@ def clone_repository(repo_url: str, target_dir: Optional[str] = None) -> str:
         else:
             print(f"Creating new branch {migration_branch} for migration...")
             repo.git.checkout('-b', migration_branch)
-        
-        return target_path
+
+        return target_path, repo
     except git.GitCommandError as e:
         print(f"Error cloning repository: {e}")
         if not target_dir:  # Clean up temp dir if we created it
@@ -93,55 +125,133 @@ def scan_repository(repo_path: str) -> List[str]:
     nose_files = find_nose_test_files(repo_path)
     return nose_files
 
-def migrate_tests(repo_path: str, nose_files: List[str]) -> Tuple[List[str], List[Tuple[str, str]]]:
+def _rel_path(file_path: str, repo_path: str) -> str:
+    """Relative path of file_path under repo_path, interned.
+
+    Every file discovered by the scan shares the repo_path prefix, so a
+    plain slice avoids relpath's normalization work, and interning lets the
+    duplicated strings stored in the result lists (and compared again in
+    commit_changes) share storage.
+    """
+    prefix_len = len(repo_path.rstrip(os.sep)) + 1
+    if file_path.startswith(repo_path):
+        return sys.intern(file_path[prefix_len:])
+    return os.path.relpath(file_path, repo_path)
+
+def _transform_one(file_path: str, repo_path: str) -> Tuple[str, bool, str]:
+    """
+    Apply transformations to a single test file (process-pool worker).
+
+    Args:
+        file_path: Path to the test file
+        repo_path: Path to the repository
+
+    Returns:
+        Tuple of (rel_path, success, summary)
+    """
+    rel_path = _rel_path(file_path, repo_path)
+    success, summary = migrate_file(file_path)
+    return rel_path, success, summary
+
+def migrate_tests(repo_path: str, nose_files: List[str], jobs: Optional[int] = None) -> Tuple[List[str], List[Tuple[str, str]]]:
     """
     Migrate nose tests to pytest.
-    
+
+    Transforms run in a process pool (pass jobs=1 for the serial path),
+    then all transformed files are verified with a single batched pytest
+    run rather than one subprocess per file.
+
     Args:
         repo_path: Path to the repository
         nose_files: List of nose test files
-        
+        jobs: Number of worker processes (defaults to CPU count)
+
     Returns:
         Tuple of (successful_migrations, failed_migrations)
     """
     print(f"Migrating {len(nose_files)} nose tests to pytest...")
-    
+
     successful_migrations = []
     failed_migrations = []
-    
-    for file_path in nose_files:
-        rel_path = os.path.relpath(file_path, repo_path)
+
+    jobs = jobs or os.cpu_count() or 1
+
+    # Phase 1: apply transformations to every file
+    transformed = []  # (rel_path, summary) for files with applied transforms
+
+    if jobs == 1 or len(nose_files) == 1:
+        results = (_transform_one(file_path, repo_path) for file_path in nose_files)
+        for rel_path, success, summary in results:
+            if success:
+                transformed.append((rel_path, summary))
+            else:
+                print(f"\nMigrating {rel_path}...")
+                print("  No transformations applied.")
+                failed_migrations.append((rel_path, "No transformations applied"))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [executor.submit(_transform_one, file_path, repo_path)
+                       for file_path in nose_files]
+            for future in as_completed(futures):
+                rel_path, success, summary = future.result()
+                if success:
+                    transformed.append((rel_path, summary))
+                else:
+                    print(f"\nMigrating {rel_path}...")
+                    print("  No transformations applied.")
+                    failed_migrations.append((rel_path, "No transformations applied"))
+
+    # Phase 2: verify all transformed files in one pytest run
+    abs_paths = [os.path.join(repo_path, rel_path) for rel_path, _ in transformed]
+    verification = verify_migrations_batch(abs_paths)
+
+    # Phase 3: replay per-file results
+    for rel_path, summary in transformed:
+        abs_path = os.path.join(repo_path, rel_path)
+        verified, stdout, stderr = verification.get(abs_path, (False, "", ""))
+
         print(f"\nMigrating {rel_path}...")
-        
-        # Apply transformations
-        success, summary = migrate_file(file_path)
-        
-        if not success:
-            print("  No transformations applied.")
-            failed_migrations.append((rel_path, "No transformations applied"))
-            continue
-        
         print("  Applied transformations:")
         print(summary)
-        
-        # Verify the migrated file works
         print("  Verifying migration...")
-        verification_success, stdout, stderr = verify_migration(file_path)
-        
-        if verification_success:
+
+        if verified:
             print("  ✅ Verification successful!")
             successful_migrations.append(rel_path)
-            
+
             # Update migration tracking
-            update_test_status(file_path)
+            update_test_status(abs_path)
         else:
             print("  ❌ Verification failed!")
             if stderr.strip():
                 print(f"  Error: {stderr.strip()}")
             failed_migrations.append((rel_path, "Verification failed"))
-    
+
     return successful_migrations, failed_migrations
 
+_REPORT_TEMPLATE = """# Nose to Pytest Migration Report
+
+Generated on: {timestamp}
+
+## Summary
+
+- Total test files scanned: {total}
+- Successfully migrated: {successful_count} ({success_rate:.1f}%)
+- Failed migrations: {failed_count}
+
+## Successfully Migrated Files
+
+{successful_block}
+
+## Failed Migrations
+
+{failed_block}
+
+## Next Steps
+
+{next_steps_block}
+"""
+
 def generate_report(repo_path: str, successful: List[str], failed: List[Tuple[str, str]]) -> str:
     """
     Generate a migration report.
@@ -155,106 +265,102 @@ def generate_report(repo_path: str, successful: List[str], failed: List[Tuple[st
         Path to the generated report file
     """
     report_path = os.path.join(repo_path, "pytest_migration_report.md")
-    
+
+    total = len(successful) + len(failed)
+    success_rate = (len(successful) / total) * 100 if total > 0 else 0
+
+    successful_block = "\n".join(f"- ✅ {path}" for path in successful) \
+        or "No files were successfully migrated."
+    failed_block = "\n".join(f"- ❌ {path} - {reason}" for path, reason in failed) \
+        or "No migration failures."
+
+    next_steps = []
+    if failed:
+        next_steps.append("1. Manually review failed migration files")
+        next_steps.append("2. Consider addressing issues and re-running the migration tool")
+    next_steps.append("3. Run your test suite to ensure all migrated tests pass")
+    next_steps.append("4. Update your CI configuration to use pytest instead of nose")
+    next_steps.append("5. Remove nose from your dependencies")
+
+    report = _REPORT_TEMPLATE.format_map({
+        "timestamp": datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        "total": total,
+        "successful_count": len(successful),
+        "success_rate": success_rate,
+        "failed_count": len(failed),
+        "successful_block": successful_block,
+        "failed_block": failed_block,
+        "next_steps_block": "\n".join(next_steps),
+    })
+
     with open(report_path, 'w') as f:
-        f.write("# Nose to Pytest Migration Report\n\n")
-        f.write(f"Generated on: {subprocess.check_output(['date']).decode().strip()}\n\n")
-        
-        # Summary
-        total = len(successful) + len(failed)
-        success_rate = (len(successful) / total) * 100 if total > 0 else 0
-        
-        f.write("## Summary\n\n")
-        f.write(f"- Total test files scanned: {total}\n")
-        f.write(f"- Successfully migrated: {len(successful)} ({success_rate:.1f}%)\n")
-        f.write(f"- Failed migrations: {len(failed)}\n\n")
-        
-        # Successful migrations
-        f.write("## Successfully Migrated Files\n\n")
-        if successful:
-            for path in successful:
-                f.write(f"- ✅ {path}\n")
-        else:
-            f.write("No files were successfully migrated.\n")
-        
-        # Failed migrations
-        f.write("\n## Failed Migrations\n\n")
-        if failed:
-            for path, reason in failed:
-                f.write(f"- ❌ {path} - {reason}\n")
-        else:
-            f.write("No migration failures.\n")
-        
-        # Next steps
-        f.write("\n## Next Steps\n\n")
-        if failed:
-            f.write("1. Manually review failed migration files\n")
-            f.write("2. Consider addressing issues and re-running the migration tool\n")
-        f.write("3. Run your test suite to ensure all migrated tests pass\n")
-        f.write("4. Update your CI configuration to use pytest instead of nose\n")
-        f.write("5. Remove nose from your dependencies\n")
-    
+        f.write(report)
+
     print(f"Generated migration report: {report_path}")
     return report_path
 
-def commit_changes(repo_path: str, successful_migrations: List[str]) -> bool:
+def commit_changes(repo_path: str, repo: "git.Repo", successful_migrations: List[str]) -> bool:
     """
     Commit the migrated files to the Git repository.
-    
+
     Args:
         repo_path: Path to the repository
+        repo: Already-open Repo object for the repository
         successful_migrations: List of successfully migrated files
-        
+
     Returns:
         True if commit was successful, False otherwise
     """
     if not successful_migrations:
         print("No successful migrations to commit.")
         return False
-    
+
     try:
-        repo = git.Repo(repo_path)
-        
-        # Check if there are changes to commit
-        if not repo.is_dirty() and not repo.untracked_files:
-            print("No changes to commit.")
-            return False
-        
-        # Add all successfully migrated files
-        for file_path in successful_migrations:
-            abs_path = os.path.join(repo_path, file_path)
-            repo.git.add(abs_path)
-        
-        # Add the migration report if it exists
+        # No pre-check for changes here: is_dirty() and untracked_files each
+        # cost a full git-status-class walk of the worktree. We know exactly
+        # which files we staged, so just attempt the commit and let git tell
+        # us if there was nothing to record.
+
+        # Stage all successfully migrated files (plus the report) through the
+        # index API in one call rather than forking `git add` per file
+        abs_paths = [os.path.join(repo_path, file_path) for file_path in successful_migrations]
+
         report_path = os.path.join(repo_path, "pytest_migration_report.md")
         if os.path.exists(report_path):
-            repo.git.add(report_path)
-        
-        # Commit the changes
-        commit_message = "Migrate nose tests to pytest\n\n"
-        commit_message += f"Successfully migrated {len(successful_migrations)} tests:\n"
-        
-        # Add up to 10 files to the commit message
-        for file_path in successful_migrations[:10]:
-            commit_message += f"- {file_path}\n"
+            abs_paths.append(report_path)
+
+        repo.index.add(abs_paths)
         
+        # Commit the changes, listing up to 10 files in the message
+        lines = [
+            "Migrate nose tests to pytest",
+            "",
+            f"Successfully migrated {len(successful_migrations)} tests:",
+        ]
+        lines.extend(f"- {file_path}" for file_path in successful_migrations[:10])
+
         if len(successful_migrations) > 10:
-            commit_message += f"- and {len(successful_migrations) - 10} more files\n"
-        
-        repo.git.commit('-m', commit_message)
+            lines.append(f"- and {len(successful_migrations) - 10} more files")
+
+        repo.git.commit('-m', "\n".join(lines))
         
         print(f"Changes committed to branch {repo.active_branch.name}")
         return True
         
     except git.GitCommandError as e:
-        print(f"Error committing changes: {e}")
+        if "nothing to commit" in (str(e.stdout) + str(e.stderr)):
+            print("No changes to commit.")
+        else:
+            print(f"Error committing changes: {e}")
         return False
 
 def main():
     args = parse_args()
     
     # Clone the repository
-    repo_path = clone_repository(args.repo_url, args.target_dir)
+    repo_path, repo = clone_repository(args.repo_url, args.target_dir,
+                                       full_clone=args.full_clone,
+                                       use_shm=not args.no_shm)
     
     # Scan for nose tests
     nose_files = scan_repository(repo_path)
@@ -270,14 +376,14 @@ def main():
     migration_data = create_default_migration_data()
     
     # Migrate tests
-    successful, failed = migrate_tests(repo_path, nose_files)
+    successful, failed = migrate_tests(repo_path, nose_files, jobs=args.jobs)
     
     # Generate report
     report_path = generate_report(repo_path, successful, failed)
     
     # Commit changes if there were successful migrations
     if successful:
-        commit_result = commit_changes(repo_path, successful)
+        commit_result = commit_changes(repo_path, repo, successful)
         if commit_result:
             print("Migration changes committed to Git repository.")
     
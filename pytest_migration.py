@@ -26,67 +26,91 @@ Learn more: https://github.com/yourusername/pytest_migration
 import os
 import sys
 import argparse
+import functools
 import importlib.util
 
-# Detect if this is the first run or if modules are already available
-modules_available = False
-try:
-    from pytest_migration_lib import tracking, automigrate
-    modules_available = True
-except ImportError:
-    pass
+def _modules_findable():
+    """Probe for the migration modules without importing them."""
+    try:
+        return (importlib.util.find_spec("pytest_migration_lib.tracking") is not None
+                and importlib.util.find_spec("pytest_migration_lib.automigrate") is not None)
+    except ModuleNotFoundError:
+        return False
 
-def ensure_modules():
-    """Ensure migration modules are available."""
-    global modules_available
-    
-    # If modules are already imported, we're good
-    if modules_available:
+@functools.lru_cache(maxsize=1)
+def _ensure_modules_cached():
+    """Probe for migration modules, bootstrapping the directory if needed.
+
+    Uses find_spec rather than a real import so the probe stays cheap;
+    the command handlers import only the submodule they actually need.
+    """
+    if _modules_findable():
         return True
-        
+
     # Check if modules are in the expected location
     module_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pytest_migration_lib')
-    
+
     if not os.path.isdir(module_dir):
         # Create the module directory
         os.makedirs(module_dir, exist_ok=True)
-        
+
         # Create __init__.py
         with open(os.path.join(module_dir, '__init__.py'), 'w') as f:
             f.write('# Pytest migration library\n')
-        
+
         print(f"Created module directory at {module_dir}")
         print("Please copy the migration modules to this directory.")
         return False
-    
+
     # Check if tracking module exists
     tracking_path = os.path.join(module_dir, 'tracking.py')
     automigrate_path = os.path.join(module_dir, 'automigrate.py')
-    
+
     if not os.path.exists(tracking_path) or not os.path.exists(automigrate_path):
         print("Migration modules not found in expected location.")
         print(f"Please copy migration modules to {module_dir}:")
         print(f"  - tracking.py (migration tracking module)")
         print(f"  - automigrate.py (automated migration module)")
         return False
-    
-    # Try to import the modules
-    try:
-        sys.path.insert(0, os.path.dirname(module_dir))
-        from pytest_migration_lib import tracking, automigrate
-        modules_available = True
+
+    parent = os.path.dirname(module_dir)
+    if parent not in sys.path:
+        sys.path.insert(0, parent)
+    if _modules_findable():
         return True
-    except ImportError as e:
-        print(f"Error importing migration modules: {e}")
-        return False
+
+    print("Error importing migration modules.")
+    return False
+
+def ensure_modules():
+    """Ensure migration modules are available.
+
+    The probe result — including a negative one — is cached, so a
+    known-bad install does not re-walk the filesystem on every command.
+    Set NOSEY_PYTEST_RETRY_IMPORT=1 to force a fresh probe.
+    """
+    if os.environ.get("NOSEY_PYTEST_RETRY_IMPORT"):
+        _ensure_modules_cached.cache_clear()
+    return _ensure_modules_cached()
+
+_CWD = None
+
+def _resolve(path):
+    """Resolve a CLI path argument against a cached working directory."""
+    global _CWD
+    if os.path.isabs(path):
+        return path
+    if _CWD is None:
+        _CWD = os.getcwd()
+    return os.path.join(_CWD, path)
 
 def track_command(args):
     """Handle tracking commands."""
     if not ensure_modules():
         return 1
-        
+
     from pytest_migration_lib import tracking
-    
+
     if args.subcommand == 'init':
         return tracking.initialize_migration()
     elif args.subcommand == 'status':
@@ -95,12 +119,9 @@ def track_command(args):
         if not args.path:
             print("Error: Missing file path.")
             return 1
-        abs_path = os.path.abspath(args.path) if os.path.isabs(args.path) else os.path.join(os.getcwd(), args.path)
-        tracking.update_test_status(abs_path)
+        tracking.update_test_status(_resolve(args.path))
     elif args.subcommand == 'scan':
-        dir_path = None
-        if args.path:
-            dir_path = os.path.abspath(args.path) if os.path.isabs(args.path) else os.path.join(os.getcwd(), args.path)
+        dir_path = _resolve(args.path) if args.path else None
         tracking.rescan_tests(dir_path)
     else:
         print("Unknown track command.")
@@ -125,80 +146,88 @@ def auto_command(args):
     """Handle auto commands."""
     if not ensure_modules():
         return 1
-        
+
     from pytest_migration_lib import automigrate
-    
-    if args.subcommand == 'scan':
-        automigrate.scan_command(args.path if hasattr(args, 'path') else None)
-    elif args.subcommand == 'migrate':
-        automigrate.migrate_command(args.path if hasattr(args, 'path') else None)
-    elif args.subcommand == 'verify':
-        automigrate.verify_command()
-    elif args.subcommand == 'config':
-        automigrate.update_config()
-    elif args.subcommand == 'patterns':
-        automigrate.list_patterns_command()
-    elif args.subcommand == 'add-pattern':
-        automigrate.add_pattern_command()
-    else:
+
+    dispatch = {
+        'scan': lambda: automigrate.scan_command(args.path),
+        'migrate': lambda: automigrate.migrate_command(args.path),
+        'verify': automigrate.verify_command,
+        'config': automigrate.update_config,
+        'patterns': automigrate.list_patterns_command,
+        'add-pattern': automigrate.add_pattern_command,
+    }
+
+    fn = dispatch.get(args.subcommand)
+    if fn is None:
         print("Unknown auto command.")
         return 1
-    
+
+    fn()
     return 0
 
-def main():
-    """Main entry point for the migration tool."""
-    parser = argparse.ArgumentParser(description="Universal nose to pytest migration toolkit")
-    subparsers = parser.add_subparsers(dest="command", help="Command group")
-    
-    # Track commands
-    track_parser = subparsers.add_parser("track", help="Migration tracking commands")
-    track_subparsers = track_parser.add_subparsers(dest="subcommand", help="Tracking command")
-    
-    init_parser = track_subparsers.add_parser("init", help="Initialize migration tracking")
-    
-    status_parser = track_subparsers.add_parser("status", help="Show migration status")
-    
+def _build_track_parser():
+    """Build the parser for track subcommands."""
+    parser = argparse.ArgumentParser(prog="pytest_migration.py track",
+                                     description="Migration tracking commands")
+    track_subparsers = parser.add_subparsers(dest="subcommand", help="Tracking command")
+
+    track_subparsers.add_parser("init", help="Initialize migration tracking")
+    track_subparsers.add_parser("status", help="Show migration status")
+
     update_parser = track_subparsers.add_parser("update", help="Mark a file as migrated")
     update_parser.add_argument("path", help="Path to migrated test file")
-    
+
     scan_parser = track_subparsers.add_parser("scan", help="Scan for test files")
-    scan_parser.add_argument("path", nargs="?", help="Directory to scan (optional)")
-    
-    # Run commands
-    run_parser = subparsers.add_parser("run", help="Run tests with pytest")
-    run_parser.add_argument("path", help="Path to test file or directory")
-    
-    # Auto commands
-    auto_parser = subparsers.add_parser("auto", help="Automated migration commands")
-    auto_subparsers = auto_parser.add_subparsers(dest="subcommand", help="Automation command")
-    
+    scan_parser.add_argument("path", nargs="?", default=None, help="Directory to scan (optional)")
+
+    return parser
+
+def _build_run_parser():
+    """Build the parser for the run command."""
+    parser = argparse.ArgumentParser(prog="pytest_migration.py run",
+                                     description="Run tests with pytest")
+    parser.add_argument("path", help="Path to test file or directory")
+    return parser
+
+def _build_auto_parser():
+    """Build the parser for auto subcommands."""
+    parser = argparse.ArgumentParser(prog="pytest_migration.py auto",
+                                     description="Automated migration commands")
+    auto_subparsers = parser.add_subparsers(dest="subcommand", help="Automation command")
+
     auto_scan_parser = auto_subparsers.add_parser("scan", help="Scan for nose tests")
-    auto_scan_parser.add_argument("path", nargs="?", help="Directory to scan (optional)")
-    
+    auto_scan_parser.add_argument("path", nargs="?", default=None, help="Directory to scan (optional)")
+
     auto_migrate_parser = auto_subparsers.add_parser("migrate", help="Run automated migration")
-    auto_migrate_parser.add_argument("path", nargs="?", help="Path to migrate (file or directory)")
-    
-    auto_verify_parser = auto_subparsers.add_parser("verify", help="Verify migrated tests")
-    
-    auto_config_parser = auto_subparsers.add_parser("config", help="Configure auto-migration settings")
-    
-    auto_patterns_parser = auto_subparsers.add_parser("patterns", help="List transformation patterns")
-    
-    auto_add_pattern_parser = auto_subparsers.add_parser("add-pattern", help="Add a new transformation pattern")
-    
-    args = parser.parse_args()
-    
-    if args.command == "track":
-        return track_command(args)
-    elif args.command == "run":
-        return run_command(args)
-    elif args.command == "auto":
-        return auto_command(args)
-    else:
-        parser.print_help()
-    
-    return 0
+    auto_migrate_parser.add_argument("path", nargs="?", default=None, help="Path to migrate (file or directory)")
+
+    auto_subparsers.add_parser("verify", help="Verify migrated tests")
+    auto_subparsers.add_parser("config", help="Configure auto-migration settings")
+    auto_subparsers.add_parser("patterns", help="List transformation patterns")
+    auto_subparsers.add_parser("add-pattern", help="Add a new transformation pattern")
+
+    return parser
+
+COMMANDS = {
+    "track": (_build_track_parser, track_command),
+    "run": (_build_run_parser, run_command),
+    "auto": (_build_auto_parser, auto_command),
+}
+
+def main():
+    """Main entry point for the migration tool."""
+    # Only the parser for the requested command is ever constructed; the
+    # module docstring doubles as the top-level help text.
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+
+    if command not in COMMANDS:
+        print(__doc__)
+        return 0 if command in (None, "-h", "--help") else 1
+
+    build_parser, handler = COMMANDS[command]
+    args = build_parser().parse_args(sys.argv[2:])
+    return handler(args)
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
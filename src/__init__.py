@@ -6,6 +6,20 @@ A collection of tools for migrating from nose to pytest.
 This package includes:
 - tracking: Tools for tracking migration progress
 - automigrate: Tools for automatically converting nose tests to pytest
+- assert_tools: Pytest replacements for nose.tools assertion helpers
+
+Submodules are loaded lazily on first attribute access, so consumers that
+only need tracking never pay for automigrate's heavier imports.
 """
 
-__version__ = "0.1.0"
\ No newline at end of file
+__version__ = "0.1.0"
+
+__all__ = ["tracking", "automigrate", "assert_tools"]
+
+def __getattr__(name):
+    if name in __all__:
+        import importlib
+        mod = importlib.import_module(f".{name}", __name__)
+        globals()[name] = mod
+        return mod
+    raise AttributeError(name)
\ No newline at end of file
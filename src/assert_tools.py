@@ -0,0 +1,75 @@
+"""
+Pytest-compatible replacements for nose.tools assertion helpers.
+
+nose.tools provides a few assertion helpers that have no direct assert
+statement equivalent. This module offers drop-in replacements so migrated
+tests can keep their call sites, either imported directly or registered
+via pytest_configure.
+"""
+
+__all__ = [
+    'assert_dict_contains_subset',
+    'assert_raises_regex',
+    'assert_raises_regexp',
+    'assert_regexp_matches',
+    'assert_warns_regex',
+]
+
+# Sentinel distinguishing "key absent" from "value is None"
+_MISSING = object()
+
+def assert_dict_contains_subset(subset, dictionary, msg=None):
+    """Assert that dictionary contains every key/value pair in subset.
+
+    A single pass over subset collects missing keys and mismatched values
+    together, so each key is hashed once and nothing is allocated on the
+    common all-matching path.
+    """
+    missing_keys = []
+    mismatch_vals = {}
+
+    for key, expected in subset.items():
+        actual = dictionary.get(key, _MISSING)
+        if actual is _MISSING:
+            missing_keys.append(key)
+        elif actual != expected:
+            mismatch_vals[key] = (expected, actual)
+
+    if missing_keys:
+        missing_keys.sort()
+
+    suffix = f" : {msg}" if msg else ""
+    assert not missing_keys, f"Missing keys: {missing_keys}{suffix}"
+    assert not mismatch_vals, f"Mismatched values (expected, actual): {mismatch_vals}{suffix}"
+
+def _make_regex_asserts():
+    """Wrap unittest's regex-assert implementations as plain functions.
+
+    Each wrapper constructs a throwaway TestCase per call rather than
+    keeping one alive at module scope, so no instance (or its _cleanups
+    list) outlives the assertion.
+    """
+    import unittest
+
+    _TC = unittest.TestCase
+
+    def _mk(method):
+        def _fn(*args, **kwargs):
+            return method(_TC(), *args, **kwargs)
+        _fn.__name__ = method.__name__
+        return _fn
+
+    return _mk(_TC.assertRaisesRegex), _mk(_TC.assertRegex), _mk(_TC.assertWarnsRegex)
+
+assert_raises_regex, assert_regexp_matches, assert_warns_regex = _make_regex_asserts()
+assert_raises_regexp = assert_raises_regex
+
+def pytest_configure(config):
+    """Expose the helpers as pytest.* attributes for legacy call sites."""
+    import pytest
+
+    pytest.assert_dict_contains_subset = assert_dict_contains_subset
+    pytest.assert_raises_regex = assert_raises_regex
+    pytest.assert_raises_regexp = assert_raises_regexp
+    pytest.assert_regexp_matches = assert_regexp_matches
+    pytest.assert_warns_regex = assert_warns_regex
@@ -9,10 +9,12 @@ import os
 import sys
 import json
 import re
+import mmap
 import argparse
 import datetime
 import subprocess
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Tuple, Optional, Any
 
 # Configuration
@@ -26,32 +28,55 @@ DEFAULT_CONFIG = {
     "initialized_date": None
 }
 
+# Resolved once at import; every config read/write shares these
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_CONFIG_PATH = os.path.join(_REPO_ROOT, '.pytest_migration_config.json')
+
 def get_config():
     """Get or create configuration."""
-    config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.pytest_migration_config.json')
-    
-    if not os.path.exists(config_path):
-        with open(config_path, 'w', encoding='utf-8') as f:
+    if not os.path.exists(_CONFIG_PATH):
+        with open(_CONFIG_PATH, 'w', encoding='utf-8') as f:
             json.dump(DEFAULT_CONFIG, f, indent=2)
         return DEFAULT_CONFIG
-    
-    with open(config_path, 'r', encoding='utf-8') as f:
+
+    with open(_CONFIG_PATH, 'r', encoding='utf-8') as f:
         return json.load(f)
 
 CONFIG = get_config()
 PROJECT_ROOT = CONFIG["project_root"]
 MIGRATION_DATA_PATH = os.path.join(PROJECT_ROOT, CONFIG["migration_data_path"])
 TEST_DIRECTORIES = [os.path.join(PROJECT_ROOT, directory) for directory in CONFIG["test_directories"]]
+_PR_PREFIX = PROJECT_ROOT.rstrip(os.sep) + os.sep
+
+def _rel_to_root(path):
+    """Fast relpath against PROJECT_ROOT.
+
+    Every tracked file lives under the project root, so a prefix slice
+    covers the common case; os.path.relpath remains the fallback for
+    anything else.
+    """
+    if path.startswith(_PR_PREFIX):
+        return path[len(_PR_PREFIX):]
+    return os.path.relpath(path, PROJECT_ROOT)
 
 def save_config(config):
-    """Save updated configuration."""
-    config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.pytest_migration_config.json')
-    with open(config_path, 'w', encoding='utf-8') as f:
-        json.dump(config, f, indent=2)
+    """Save updated configuration, skipping the write when unchanged."""
+    serialized = json.dumps(config, indent=2)
+    try:
+        # Interactive flows re-save even when every prompt kept its
+        # current value; comparing the serialized form avoids the
+        # rewrite (and mtime churn) in that case
+        with open(_CONFIG_PATH, 'r', encoding='utf-8') as f:
+            if f.read() == serialized:
+                return
+    except OSError:
+        pass
+    with open(_CONFIG_PATH, 'w', encoding='utf-8') as f:
+        f.write(serialized)
 
 def update_config():
     """Interactive configuration update."""
-    global CONFIG, PROJECT_ROOT, MIGRATION_DATA_PATH, TEST_DIRECTORIES
+    global CONFIG, PROJECT_ROOT, MIGRATION_DATA_PATH, TEST_DIRECTORIES, _PR_PREFIX
     
     config = CONFIG.copy()
     
@@ -95,7 +120,8 @@ def update_config():
     PROJECT_ROOT = config["project_root"]
     MIGRATION_DATA_PATH = os.path.join(PROJECT_ROOT, config["migration_data_path"])
     TEST_DIRECTORIES = [os.path.join(PROJECT_ROOT, directory) for directory in config["test_directories"]]
-    
+    _PR_PREFIX = PROJECT_ROOT.rstrip(os.sep) + os.sep
+
     # Save configuration
     save_config(config)
     print("\nConfiguration updated successfully!")
@@ -123,26 +149,103 @@ def create_default_migration_data():
     
     return data
 
+def _iter_tests(directory):
+    """Yield test file paths under directory via an os.scandir stack walk.
+
+    DirEntry caches the type from the directory read, so filtering on
+    entry.name costs no extra stat per file the way os.walk's list
+    building does.
+    """
+    stack = [directory]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as scan:
+                for entry in scan:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif (entry.name.startswith('test_')
+                          and entry.name.endswith('.py')
+                          and entry.is_file(follow_symlinks=False)):
+                        yield entry.path
+        except (PermissionError, FileNotFoundError):
+            continue
+
 def scan_directory_for_tests(directory):
     """Scan directory for test files and count them."""
-    test_files = []
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.startswith('test_') and file.endswith('.py'):
-                test_files.append(os.path.join(root, file))
-    return test_files
+    return list(_iter_tests(directory))
+
+# One compiled alternation over raw bytes; the separate substring checks
+# each re-walked the full decoded content
+_NOSE_RE = re.compile(rb"import nose|from nose|nose\.tools")
+
+# Import statements sit at the top of a file; 8 KB covers any realistic
+# docstring-plus-imports preamble
+_HEADER_BYTES = 8192
 
 def is_nose_test(file_path):
-    """Check if the file uses nose testing framework."""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            return ('import nose' in content or 
-                    'from nose' in content or 
-                    'nose.tools' in content)
-    except UnicodeDecodeError:
-        # Skip binary files
-        return False
+    """Check if the file uses nose testing framework.
+
+    The nose markers come from import lines, so the header read decides
+    almost every file; only a header with no match in a larger file
+    forces reading the rest (nose.tools references can appear at call
+    sites deep in the body).
+    """
+    with open(file_path, 'rb') as f:
+        content = f.read(_HEADER_BYTES)
+        if b'\x00' in content:
+            # Skip binary files
+            return False
+        if _NOSE_RE.search(content):
+            return True
+        if len(content) < _HEADER_BYTES:
+            return False
+        # Large file with a clean header: search the page cache in place
+        # via mmap rather than copying the rest into a fresh buffer.
+        # Overlap is unnecessary: all markers are far shorter than the
+        # header.
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            content += f.read()
+            return _NOSE_RE.search(content, _HEADER_BYTES - 16) is not None
+        try:
+            return _NOSE_RE.search(mm, _HEADER_BYTES - 16) is not None
+        finally:
+            mm.close()
+
+def classify_tests(directory):
+    """Discover and classify tests under directory in one traversal.
+
+    Returns (test_files, nose_count). Classification is I/O-bound — one
+    small read per file — so larger batches fan out over threads that
+    overlap the blocking syscalls; small ones stay serial to skip pool
+    startup.
+    """
+    test_files = list(_iter_tests(directory))
+    if len(test_files) < 8:
+        return test_files, sum(1 for file in test_files if is_nose_test(file))
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return test_files, sum(pool.map(is_nose_test, test_files))
+
+# In-process cache of the migration data, keyed by the file's stat so an
+# outside edit invalidates it; batch updates otherwise re-parse the same
+# JSON once per file
+_STATUS_CACHE = {"key": None, "data": None}
+
+def _save_status(status):
+    """Write migration data atomically and refresh the in-process cache.
+
+    Serializing once and renaming a temp file into place means a crash
+    mid-write can never leave a truncated tracking file behind.
+    """
+    tmp_path = MIGRATION_DATA_PATH + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(status, indent=2))
+    os.replace(tmp_path, MIGRATION_DATA_PATH)
+    st = os.stat(MIGRATION_DATA_PATH)
+    _STATUS_CACHE["key"] = (st.st_mtime_ns, st.st_size)
+    _STATUS_CACHE["data"] = status
 
 def get_test_status():
     """Get the current migration status."""
@@ -154,12 +257,10 @@ def get_test_status():
         for dir_key in default_data['directory_status']:
             dir_path = os.path.join(PROJECT_ROOT, dir_key)
             if os.path.exists(dir_path):
-                test_files = scan_directory_for_tests(dir_path)
+                # Discovery and nose classification fused in one pass
+                test_files, nose_tests = classify_tests(dir_path)
                 default_data['directory_status'][dir_key]['total'] = len(test_files)
                 default_data['total_tests'] += len(test_files)
-                
-                # Count nose tests
-                nose_tests = sum(1 for file in test_files if is_nose_test(file))
                 default_data['nose_tests'] += nose_tests
                 
                 # Test files that aren't nose tests are assumed to be pytest compatible
@@ -172,48 +273,96 @@ def get_test_status():
                     default_data['directory_status'][dir_key]['status'] = "DONE"
         
         # Save initial data
-        with open(MIGRATION_DATA_PATH, 'w', encoding='utf-8') as f:
-            json.dump(default_data, f, indent=2)
-        
+        _save_status(default_data)
+
         return default_data
-    
-    # Load existing data
+
+    # Load existing data, served from the cache while the file on disk
+    # is unchanged
+    st = os.stat(MIGRATION_DATA_PATH)
+    key = (st.st_mtime_ns, st.st_size)
+    if _STATUS_CACHE["key"] == key:
+        return _STATUS_CACHE["data"]
+
     with open(MIGRATION_DATA_PATH, 'r', encoding='utf-8') as f:
-        return json.load(f)
+        data = json.load(f)
+    _STATUS_CACHE["key"] = key
+    _STATUS_CACHE["data"] = data
+    return data
+
+class StatusUpdater:
+    """Batch interface for marking files as migrated.
+
+    Loads the status once on entry, applies each mark in memory, and
+    writes once on exit — a bulk migration pays one JSON serialization
+    instead of one per file. Nothing is written if no mark took effect
+    or the block raised.
+    """
+
+    def __enter__(self):
+        self.status = get_test_status()
+        # Set view for O(1) membership; the list stays authoritative for
+        # serialization order
+        self._migrated = set(self.status['migrated_files'])
+        # Absolute directory paths resolved once per batch, not once per
+        # mark per directory
+        self._abs_dir_map = {
+            os.path.join(PROJECT_ROOT, k): k
+            for k in self.status['directory_status']
+        }
+        self._dirty = False
+        return self
+
+    def mark(self, file_path):
+        """Mark one file as migrated; returns True if status changed."""
+        status = self.status
+
+        rel_path = _rel_to_root(file_path)
+        if rel_path in self._migrated:
+            print(f"File {rel_path} is already marked as migrated")
+            return False
 
-def update_test_status(file_path):
-    """Mark a test file as migrated."""
-    status = get_test_status()
-    
-    rel_path = os.path.relpath(file_path, PROJECT_ROOT)
-    if rel_path not in status['migrated_files']:
         status['migrated_files'].append(rel_path)
-        
-        # Update directory status
-        for dir_key in status['directory_status']:
-            dir_path = os.path.join(PROJECT_ROOT, dir_key)
-            if file_path.startswith(dir_path):
-                status['directory_status'][dir_key]['migrated'] += 1
-                
+        self._migrated.add(rel_path)
+
+        # Update directory status by walking the file's ancestors —
+        # O(path depth) dict lookups instead of a prefix test against
+        # every registered directory. Nested registered directories all
+        # see the update, as the prefix scan did.
+        parent = os.path.dirname(file_path)
+        while True:
+            dir_key = self._abs_dir_map.get(parent)
+            if dir_key is not None:
+                dir_entry = status['directory_status'][dir_key]
+                dir_entry['migrated'] += 1
+
                 # Update the status if all files in the directory are migrated
-                if status['directory_status'][dir_key]['migrated'] == status['directory_status'][dir_key]['total']:
-                    status['directory_status'][dir_key]['status'] = "DONE"
-        
+                if dir_entry['migrated'] == dir_entry['total']:
+                    dir_entry['status'] = "DONE"
+            grandparent = os.path.dirname(parent)
+            if grandparent == parent:
+                break
+            parent = grandparent
+
         # Update overall counts
         if is_nose_test(file_path):
             status['nose_tests'] -= 1
             status['pytest_tests'] += 1
-        
-        # Update last updated timestamp
-        status['last_updated'] = datetime.datetime.now().isoformat()
-        
-        # Save updated status
-        with open(MIGRATION_DATA_PATH, 'w', encoding='utf-8') as f:
-            json.dump(status, f, indent=2)
-        
+
+        self._dirty = True
         print(f"Updated status: Marked {rel_path} as migrated to pytest")
-    else:
-        print(f"File {rel_path} is already marked as migrated")
+        return True
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._dirty and exc_type is None:
+            self.status['last_updated'] = datetime.datetime.now().isoformat()
+            _save_status(self.status)
+        return False
+
+def update_test_status(file_path):
+    """Mark a test file as migrated."""
+    with StatusUpdater() as updater:
+        updater.mark(file_path)
 
 def rescan_tests(directory=None):
     """Rescan test directories and update counts."""
@@ -223,21 +372,22 @@ def rescan_tests(directory=None):
     status['total_tests'] = 0
     status['nose_tests'] = 0
     status['pytest_tests'] = 0
-    
+
+    # One set build replaces a per-file list scan in the loop below
+    migrated_set = set(status['migrated_files'])
+
     # Function to scan a specific directory
     def scan_and_update(dir_key):
         dir_path = os.path.join(PROJECT_ROOT, dir_key)
         if os.path.exists(dir_path):
-            test_files = scan_directory_for_tests(dir_path)
+            # Discovery and nose classification fused in one pass
+            test_files, nose_tests = classify_tests(dir_path)
             status['directory_status'][dir_key]['total'] = len(test_files)
             status['total_tests'] += len(test_files)
-            
-            # Count nose tests
-            nose_tests = sum(1 for file in test_files if is_nose_test(file))
             status['nose_tests'] += nose_tests
             
             # Calculate migrated tests
-            migrated_files = [f for f in test_files if os.path.relpath(f, PROJECT_ROOT) in status['migrated_files']]
+            migrated_files = [f for f in test_files if _rel_to_root(f) in migrated_set]
             status['directory_status'][dir_key]['migrated'] = len(migrated_files)
             
             # Update directory status
@@ -264,22 +414,23 @@ def rescan_tests(directory=None):
     status['last_updated'] = datetime.datetime.now().isoformat()
     
     # Save updated status
-    with open(MIGRATION_DATA_PATH, 'w', encoding='utf-8') as f:
-        json.dump(status, f, indent=2)
-    
+    _save_status(status)
+
     print(f"Rescanned {directory or 'all directories'} - found {status['total_tests']} tests ({status['nose_tests']} using nose)")
 
 def display_status():
     """Display the current migration status."""
     status = get_test_status()
-    
-    print("\n=== Nose to Pytest Migration Progress ===\n")
-    
+
+    # Accumulate the report and emit it with one write — a print per
+    # line means a lock acquire and syscall each
+    lines = ["\n=== Nose to Pytest Migration Progress ===\n"]
+
     # Overall progress
-    total = status['total_tests'] 
+    total = status['total_tests']
     migrated = status['pytest_tests']
     percent = (migrated / total) * 100 if total > 0 else 0
-    
+
     last_updated = status.get('last_updated', 'unknown')
     if isinstance(last_updated, str) and last_updated.startswith('20'):
         try:
@@ -287,29 +438,30 @@ def display_status():
             last_updated = dt.strftime('%Y-%m-%d %H:%M:%S')
         except:
             pass
-    
-    print(f"Overall Progress: {migrated}/{total} tests migrated ({percent:.1f}%)")
-    print(f"Remaining nose tests: {status['nose_tests']}")
-    print(f"Migrated to pytest: {status['pytest_tests']}")
-    print(f"Last updated: {last_updated}")
-    print("\nDirectory Status:")
-    
+
+    lines.append(f"Overall Progress: {migrated}/{total} tests migrated ({percent:.1f}%)")
+    lines.append(f"Remaining nose tests: {status['nose_tests']}")
+    lines.append(f"Migrated to pytest: {status['pytest_tests']}")
+    lines.append(f"Last updated: {last_updated}")
+    lines.append("\nDirectory Status:")
+
     for dir_key, dir_status in status['directory_status'].items():
         dir_percent = (dir_status['migrated'] / dir_status['total']) * 100 if dir_status['total'] > 0 else 0
         status_str = f"{dir_status['status']}: {dir_status['migrated']}/{dir_status['total']} ({dir_percent:.1f}%)"
-        print(f"  - {dir_key}: {status_str}")
-    
-    print("\nNext steps:")
+        lines.append(f"  - {dir_key}: {status_str}")
+
+    lines.append("\nNext steps:")
     if status['nose_tests'] > 0:
-        print("  1. Migrate the remaining nose tests to pytest")
-        print("  2. Run tests with: ./pytest_migration.py run <path>")
-        print("  3. Update migration status: ./pytest_migration.py track update <path>")
+        lines.append("  1. Migrate the remaining nose tests to pytest")
+        lines.append("  2. Run tests with: ./pytest_migration.py run <path>")
+        lines.append("  3. Update migration status: ./pytest_migration.py track update <path>")
     else:
-        print("  1. Re-enable coverage in pytest.ini if needed")
-        print("  2. Remove nose from requirements")
-        print("  3. Update CI configuration to use pytest")
-    
-    print("\n=== End of Migration Status ===\n")
+        lines.append("  1. Re-enable coverage in pytest.ini if needed")
+        lines.append("  2. Remove nose from requirements")
+        lines.append("  3. Update CI configuration to use pytest")
+
+    lines.append("\n=== End of Migration Status ===\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def run_test(test_path):
     """Run tests with pytest."""